@@ -1,16 +1,20 @@
 import konsole
 
 from argparse import ArgumentParser
-from datetime import datetime
-from pathlib import Path
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import BinaryIO
 
-from .animator import InvalidPragma
-from .perform import perform
 
+IO_BUFFER_SIZE = 128 * 1024
+CHUNK_SIZE = 512
 
+
+@lru_cache(maxsize=None)
 def create_parser() -> ArgumentParser:
     parser = ArgumentParser(
         prog="ascii-fx",
+        allow_abbrev=False,
         description="Turn a Python script into a simulated interactive session. The "
         "resulting asciicast is written to the current working directory by default.",
     )
@@ -54,37 +58,91 @@ def create_parser() -> ArgumentParser:
     return parser
 
 
+def write_chunked(file: BinaryIO, lines: Iterable[str]) -> int:
+    """
+    Write lines in chunks of CHUNK_SIZE and return the number of lines. Each
+    chunk is encoded as UTF-8 with a single call.
+    """
+    count = 0
+    chunk: list[str] = []
+    append = chunk.append
+    for line in lines:
+        append(line)
+        if len(chunk) >= CHUNK_SIZE:
+            file.write("".join(chunk).encode("utf8"))
+            count += len(chunk)
+            chunk.clear()
+
+    file.write("".join(chunk).encode("utf8"))
+    return count + len(chunk)
+
+
 def main() -> None:
     parser = create_parser()
     options = parser.parse_args()
 
+    # Defer remaining imports, so that --help and usage errors need not load them.
+    from datetime import datetime
+    import io
+    import os
+    from pathlib import Path
+    import shutil
+
+    from .animator import InvalidPragma
+    from .perform import perform
+
     if options.verbose:
         konsole.config(level=konsole.DEBUG)
 
     if not options.title:
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        options.title = f'Created by ascii-fx on {now} from "{options.input}"'
+        now = datetime.now()
+        options.title = (
+            f'Created by ascii-fx on {now:%Y-%m-%d %H:%M:%S} from "{options.input}"'
+        )
 
     try:
-        input_path = Path(options.input).resolve()
-
-        with open(input_path, mode="r", encoding="utf8") as file:
-            events, effective_width, effective_height = perform(
-                file,
-                speed=options.speed,
-                keypress_speed=options.keypress_speed,
-                width=options.width,
-                height=options.height,
-                title=options.title,
-            )
+        # Absolute paths suffice for the log, with no need to resolve symlinks.
+        input_path = Path(os.path.abspath(options.input))
 
         if options.output:
-            output_path = Path(options.output).resolve()
+            output_path = Path(os.path.abspath(options.output))
         else:
             output_path = Path.cwd() / input_path.with_suffix(".cast").name
 
-        with open(output_path, mode="w", encoding="utf8") as file:
-            file.writelines(events)
+        # Read the script in one go. Unlike str.splitlines(), StringIO splits
+        # only at newlines, just like iterating over the file does.
+        script = io.StringIO(input_path.read_text(encoding="utf8"))
+        events, animator = perform(
+            script,
+            speed=options.speed,
+            keypress_speed=options.keypress_speed,
+            width=options.width,
+            height=options.height,
+            title=options.title,
+        )
+
+        # Events are rendered while being written. So write to a temporary
+        # file next to the asciicast and only replace the latter on success.
+        # Resolve symlinks, so that the asciicast is written through them.
+        # The larger buffer coalesces the many short lines into fewer writes.
+        # Since write_chunked() encodes, the file needs no text layer.
+        target_path = Path(os.path.realpath(output_path))
+        temporary_path = target_path.with_name(f".{target_path.name}.{os.getpid()}")
+        try:
+            file = open(temporary_path, mode="xb", buffering=IO_BUFFER_SIZE)
+        except FileNotFoundError as x:
+            raise FileNotFoundError(x.errno, x.strerror, str(output_path)) from x
+
+        try:
+            with file:
+                event_count = write_chunked(file, events)
+            # Preserve the permissions of an existing asciicast.
+            if target_path.exists():
+                shutil.copymode(target_path, temporary_path)
+            os.replace(temporary_path, target_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
 
     except FileNotFoundError as x:
         konsole.critical('Unable to find file "%s"', x.filename)
@@ -95,9 +153,9 @@ def main() -> None:
     else:
         konsole.info(
             'Saved asciicast with %d events, %d columns, and %d lines in "%s"',
-            len(events) - 1,
-            effective_width,
-            effective_height,
+            event_count - 1,
+            animator.width,
+            animator.height,
             output_path,
         )
 
@@ -81,11 +81,12 @@ import inspect
 import math
 import random
 import re
-from typing import Callable, Optional
+from statistics import NormalDist
+from typing import Any, Callable, ClassVar, Dict, Optional
 
 from .event import Event, EventType
 from .repl import Interaction
-from .util import no_ansi_escape
+from .util import is_blank, no_ansi_escape
 
 
 OUT = EventType.OUT
@@ -108,6 +109,33 @@ class Controller:
         r"^\#\[(?P<command>[^ \t=]+)(?:[ \t]*[=][ \t]*(?P<param>[^\]]+))?\]\n$"
     )
 
+    # The parameter count for each pragma, cached per class by _pragmas().
+    _pragma_table: ClassVar[dict[str, int]]
+
+    @classmethod
+    def _pragmas(cls) -> dict[str, int]:
+        """
+        Get the parameter count for each pragma, keyed by method name. The table
+        is computed on first use for each class and then cached on the class.
+        """
+        pragmas: Optional[dict[str, int]] = cls.__dict__.get("_pragma_table")
+        if pragmas is not None:
+            return pragmas
+
+        pragmas = {}
+        for name in dir(cls):
+            if name.startswith(("_", "do_")) or not callable(getattr(cls, name)):
+                continue
+            parameter_count = len(inspect.signature(getattr(cls, name)).parameters)
+            # Unlike static and class methods, plain functions are unbound when
+            # accessed through the class and hence also list self.
+            if inspect.isfunction(inspect.getattr_static(cls, name)):
+                parameter_count -= 1
+            pragmas[name] = parameter_count
+
+        cls._pragma_table = pragmas
+        return pragmas
+
     def __init__(self) -> None:
         # The number of lines in the input script seen so far.
         self._lineno: int = 0
@@ -119,20 +147,24 @@ class Controller:
     def do_handle_pragma(self, line: str) -> bool:
         self._lineno += 1
 
+        # Only few lines are pragmas, so avoid the regex for all others.
+        if not line.startswith("#["):
+            return False
         if (match := self.SYNTAX.match(line)) is None:
             return False
 
         command, argument = match.groups()
         command = command.strip()
 
-        method = getattr(self, command.replace("-", "_"), None)
-        if method is None or not callable(method) or command.startswith(("_", "do_")):
+        name = command.replace("-", "_")
+        parameter_count = self._pragmas().get(name)
+        if parameter_count is None:
             raise InvalidPragma(
                 f'#[{command}] on line {self._lineno} is not recognized '
                 'as a valid pragma.'
             )
 
-        parameter_count = len(inspect.signature(method).parameters)
+        method = getattr(self, name)
         argument = argument if argument is None else argument.strip()
 
         if parameter_count == 0:
@@ -188,6 +220,70 @@ def as_lognorm_params(mean: float, stddev: float) -> tuple[float, float]:
     )
 
 
+def lognormal_sampler(
+    rng: Optional[random.Random] = None,
+) -> Callable[[float, float], float]:
+    """
+    Create a function that samples the log-normal distribution with the given
+    mu and sigma. It uses inverse transform sampling of the standard normal
+    distribution, which is several times faster than `random.lognormvariate()`.
+    Without a random number generator, it draws from the `random` module, which
+    `random.seed()` seeds.
+    """
+    uniform = random.random if rng is None else rng.random
+    inv_cdf, exp = NormalDist().inv_cdf, math.exp
+
+    def sample(mu: float, sigma: float) -> float:
+        # The inverse CDF is undefined for 0.0, which random() may return.
+        p = uniform()
+        while p == 0.0:
+            p = uniform()
+        return exp(mu + sigma * inv_cdf(p))
+
+    return sample
+
+
+LEFT, RIGHT, NEITHER = 0, 1, 2
+
+
+def as_hand_table(left: str, right: str) -> bytes:
+    """Map the first 256 code points to the hand typing them."""
+    return bytes(
+        LEFT if chr(c) in left else RIGHT if chr(c) in right else NEITHER
+        for c in range(256)
+    )
+
+
+def as_hand_iki(
+    left: tuple[float, float],
+    right: tuple[float, float],
+    alternate: tuple[float, float],
+) -> tuple[tuple[float, float], ...]:
+    """Arrange the IKI parameters by 3 * previous hand + current hand."""
+    # Only same-hand bigrams differ.
+    # fmt: off
+    return (
+        left, alternate, alternate,
+        alternate, right, alternate,
+        alternate, alternate, alternate,
+    )
+    # fmt: on
+
+
+class HandMap(Dict[int, str]):
+    """
+    A translation table for `str.translate()` that maps every letter to the
+    character with the code point of the hand typing it. The hands of the first
+    256 code points are taken from the given table; all others map to NEITHER.
+    """
+
+    def __init__(self, table: bytes) -> None:
+        super().__init__((c, chr(hand)) for c, hand in enumerate(table))
+
+    def __missing__(self, key: int) -> str:
+        return chr(NEITHER)
+
+
 class Animator:
     """
     The animator. This class uses a simplified and known to be inaccurate model
@@ -212,10 +308,25 @@ class Animator:
 
     # Need ln(mu^2/sqrt(mu^2 + s^2))  ln(1+ s^2/mu^2)
 
-    LEFT_IKI: tuple[float, float] = as_lognorm_params(124.37, 25.90)
-    RIGHT_IKI: tuple[float, float] = as_lognorm_params(117.24, 25.03)
-    ALTERNATE_IKI: tuple[float, float] = as_lognorm_params(108.62, 17.57)
-    SAME_LETTER_IKI: tuple[float, float] = as_lognorm_params(144.79, 27.46)
+    # IKI mean and stddev are reported in milliseconds but delays are in
+    # seconds. Scaling them before the conversion only shifts mu by -ln(1000),
+    # so sampled delays need no further adjustment.
+    LEFT_IKI: tuple[float, float] = as_lognorm_params(124.37e-3, 25.90e-3)
+    RIGHT_IKI: tuple[float, float] = as_lognorm_params(117.24e-3, 25.03e-3)
+    ALTERNATE_IKI: tuple[float, float] = as_lognorm_params(108.62e-3, 17.57e-3)
+    SAME_LETTER_IKI: tuple[float, float] = as_lognorm_params(144.79e-3, 27.46e-3)
+
+    # The hand for each of the first 256 code points, LEFT, RIGHT, or NEITHER.
+    # The tables are recomputed for every subclass, which may change the hands.
+    HAND_TABLE: bytes = as_hand_table(LEFT_HAND, RIGHT_HAND)
+    HAND_MAP: HandMap = HandMap(HAND_TABLE)
+
+    # The IKI parameters for a bigram, indexed by 3 * hand of previous letter
+    # plus hand of current letter. Like the hand tables, they are recomputed
+    # for every subclass, which may change the IKI parameters.
+    HAND_IKI: tuple[tuple[float, float], ...] = as_hand_iki(
+        LEFT_IKI, RIGHT_IKI, ALTERNATE_IKI
+    )
 
     PROMPT_DELAY: float = 0.001
     INPUT_DELAY: float = 1.0
@@ -223,18 +334,31 @@ class Animator:
     OUTPUT_INCR_DELAY: float = 0.200
     END_DELAY: float = 5.0
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "HAND_TABLE" not in cls.__dict__:
+            cls.HAND_TABLE = as_hand_table(cls.LEFT_HAND, cls.RIGHT_HAND)
+        if "HAND_MAP" not in cls.__dict__:
+            cls.HAND_MAP = HandMap(cls.HAND_TABLE)
+        if "HAND_IKI" not in cls.__dict__:
+            cls.HAND_IKI = as_hand_iki(cls.LEFT_IKI, cls.RIGHT_IKI, cls.ALTERNATE_IKI)
+
     def __init__(
         self,
         controller: Controller,
         *,
         keypress_speed: float = 1.0,
         speed: float = 1.0,
+        rng: Optional[random.Random] = None,
     ) -> None:
-        self._random_delay: Callable[[float, float], float] = random.lognormvariate
+        self._random_delay: Callable[[float, float], float] = lognormal_sampler(rng)
         self._controller: Controller = controller.do_register(self)
         self._width = 0
         self._height = 0
         self._previous_interaction: Optional[Interaction] = None
+        # The previous interaction's output line count or None if its input or
+        # output are blank.
+        self._previous_line_count: Optional[int] = None
 
         self.is_silent: bool = False
         self.next_thought_delay: Optional[float] = None
@@ -274,6 +398,10 @@ class Animator:
         yield from self.render_output(output)
 
         self._previous_interaction = interaction
+        if is_blank(input) or is_blank(output):
+            self._previous_line_count = None
+        else:
+            self._previous_line_count = output.count("\n")
         self.next_thought_delay = None
 
     def update_cast_size(self, interaction: Interaction) -> None:
@@ -293,19 +421,15 @@ class Animator:
 
     def render_input(self, input: str) -> Iterator[Event]:
         """Render the input."""
-        letters = iter(input)
-
-        previous_letter = next(letters, "")
         if self.next_thought_delay is None:
             delay = self.delay_input()
         else:
             delay = self.next_thought_delay
-        yield self.event(delay, previous_letter)
+        yield self.event(delay, input[:1])
 
-        for pending_letter in letters:
-            delay = self.delay_keypress(previous_letter, pending_letter)
-            yield self.event(delay, pending_letter)
-            previous_letter = pending_letter
+        event = self.event
+        for letter, delay in zip(input[1:], self.delay_keypresses(input)):
+            yield event(delay, letter)
 
     def render_output(self, output: str) -> Iterator[Event]:
         """Render the output."""
@@ -324,30 +448,48 @@ class Animator:
         return self.PROMPT_DELAY
 
     def delay_input(self) -> float:
-        previously = self.previous_interaction
-        if (
-            previously is None
-            or previously.input.strip() == ""
-            or previously.output.strip() == ""
-        ):
+        line_count = self._previous_line_count
+        if line_count is None:
             return self.delay_keypress("\n", "\n")
 
         # Delay increases with line count whereas increase decreases with line count.
-        line_count = previously.output.count("\n")
         return 1.0 + math.log(line_count)
 
     def delay_keypress(self, previous: str, current: str) -> float:
-        # IKI mean and stddev are in milliseconds. Adjust delay accordingly.
         if previous == current:
-            delay = self._random_delay(*self.SAME_LETTER_IKI) / 1000.0
-        if previous in self.LEFT_HAND and current in self.LEFT_HAND:
-            delay = self._random_delay(*self.LEFT_IKI) / 1000.0
-        if previous in self.RIGHT_HAND and current in self.RIGHT_HAND:
-            delay = self._random_delay(*self.RIGHT_IKI) / 1000.0
+            parameters = self.SAME_LETTER_IKI
         else:
-            delay = self._random_delay(*self.ALTERNATE_IKI) / 1000.0
-
-        return delay * self.keypress_speed
+            table = self.HAND_TABLE
+            p, c = ord(previous), ord(current)
+            p = table[p] if p < 256 else NEITHER
+            c = table[c] if c < 256 else NEITHER
+            parameters = self.HAND_IKI[3 * p + c]
+
+        return self._random_delay(*parameters) * self.keypress_speed
+
+    def delay_keypresses(self, input: str) -> list[float]:
+        """
+        Determine the delays before all but the first letter of the input. This
+        method is equivalent to invoking `delay_keypress()` on every bigram but
+        classifies and samples the entire input in one batch. If a subclass
+        overrides `delay_keypress()`, this method does invoke it on every bigram.
+        """
+        if type(self).delay_keypress is not Animator.delay_keypress:
+            delay_keypress = self.delay_keypress
+            return [delay_keypress(p, c) for p, c in zip(input, input[1:])]
+
+        # Translate all letters to their hands in one go. Each resulting
+        # character fits into a byte, and indexing bytes yields integers.
+        hands = input.translate(self.HAND_MAP).encode("latin-1")
+
+        same_letter, hand_iki = self.SAME_LETTER_IKI, self.HAND_IKI
+        parameters = [
+            same_letter if p == c else hand_iki[3 * ph + ch]
+            for p, c, ph, ch in zip(input, input[1:], hands, hands[1:])
+        ]
+
+        random_delay, speed = self._random_delay, self.keypress_speed
+        return [random_delay(mu, sigma) * speed for mu, sigma in parameters]
 
     def delay_output(self, index: int, section: str) -> float:
         if index == 0:
@@ -1,12 +1,11 @@
 from __future__ import annotations
 from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import json
-import math
+from json.encoder import encode_basestring_ascii
 import os
-import sys
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 class EventType(Enum):
@@ -16,18 +15,17 @@ class EventType(Enum):
     OUT = "o"
 
 
-@dataclass(frozen=True)
-class Event:
+# Enum.value is a descriptor and hence slower to access than a dictionary.
+EVENT_CODES: dict[EventType, str] = {type: type.value for type in EventType}
+
+
+class Event(NamedTuple):
     """An event."""
 
     time: float
     type: EventType
     data: str
 
-    # Dataclasses gained support for slots with Python 3.10
-    if sys.version_info >= (3, 10):
-        __slots__ = ("time", "type", "data")
-
     @classmethod
     def parse(cls, line: str) -> Event:
         """Parse a line listing a requirement."""
@@ -50,15 +48,24 @@ class Event:
         return self.as_json()
 
     def as_json(self, fix_newline: bool = True) -> str:
-        data = json.dumps(self.data)
-        if fix_newline:
-            data = data.replace("\\n", "\\r\\n")
-        return f'[{self.time:.4f}, "{self.type.value}", {data}]'
+        return format_event(self.time, self.type, self.data, fix_newline)
+
+
+def format_event(
+    time: float, type: EventType, data: str, fix_newline: bool = True
+) -> str:
+    """Format the event's fields as JSON."""
+    # Fixing newlines before encoding leaves escaped backslashes intact.
+    if fix_newline:
+        data = data.replace("\n", "\r\n")
+    # This is the C function json.dumps() delegates to for strings.
+    json_data = encode_basestring_ascii(data)
+    return f'[{time:.4f}, "{EVENT_CODES[type]}", {json_data}]'
 
 
 def get_duration(events: Iterable[Event]) -> float:
     """Determine event stream's duration. This function requires relative times."""
-    return math.fsum(event.time for event in events)
+    return sum(event.time for event in events)
 
 
 def with_absolute_time(events: Iterable[Event]) -> Iterator[Event]:
@@ -93,8 +100,7 @@ def with_max_time(events: Iterable[Event], maximum: float = 10.0) -> Iterator[Ev
         yield Event(maximum, event.type, event.data)
 
 
-@dataclass(frozen=True)
-class Header:
+class Header(NamedTuple):
     """A header for asciicast v2 files."""
 
     width: int = 80
@@ -106,20 +112,48 @@ class Header:
         return Header(self.width, self.height, self.title, duration)
 
     def __str__(self) -> str:
-        header = {
-            "version": 2,
-            "width": self.width,
-            "height": self.height,
-            "title": self.title,
-        }
+        return format_header(self)
+
+
+@lru_cache(maxsize=16)
+def format_header(header: Header) -> str:
+    """Format the header as JSON. Since headers are immutable, cache the result."""
+    fields = {
+        "version": 2,
+        "width": header.width,
+        "height": header.height,
+        "title": header.title,
+    }
 
-        if self.duration is not None:
-            header.update(duration=self.duration)
+    if header.duration is not None:
+        fields.update(duration=header.duration)
 
-        return json.dumps(header)
+    return json.dumps(fields)
 
 
 def to_json_lines(header: Header, events: Iterable[Event]) -> Iterator[str]:
     yield f'{header}\n'
     for event in events:
         yield f'{event}\n'
+
+
+def to_json_text(header: Header, events: Iterable[Event]) -> str:
+    """
+    Convert the header and events to newline-delimited JSON as one string.
+    Use this function when writing the whole asciicast at once and
+    `to_json_lines()` when streaming it.
+    """
+    return "\n".join([str(header), *map(str, events), ""])
+
+
+def to_absolute_json_lines(header: Header, events: Iterable[Event]) -> Iterator[str]:
+    """
+    Convert an event stream with relative times to newline-delimited JSON with
+    absolute times. This function is equivalent to `to_json_lines(header,
+    with_absolute_time(events))` but does not create intermediate events.
+    """
+    yield f'{header}\n'
+    time = 0.0
+    for event in events:
+        time += event.time
+        yield f'{format_event(time, event.type, event.data)}\n'
@@ -1,7 +1,7 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator
 
 from .animator import Animator, Controller
-from .event import Header, to_json_lines, with_absolute_time
+from .event import Event, Header, to_absolute_json_lines
 from .repl import PyRepl, Repl
 
 
@@ -16,15 +16,16 @@ def perform(
     AnimatorClass: type[Animator] = Animator,
     ControllerClass: type[Controller] = Controller,
     ReplClass: type[Repl] = PyRepl,
-) -> tuple[Sequence[str], int, int]:
+) -> tuple[Iterator[str], Animator]:
     """
     Turn a script into an asciicast performance. This function feeds the given
     script line by line into a new instance of the given REPL. It then animates
     the resulting interactions with new instances of the given animator and
     controller. Finally, it converts the resulting events into newline-delimited
-    JSON. This function returns the sequence of events as newline-delimited
-    JSON, the maximum number of columns taken up by the asciicast, and the
-    number of lines taken up by the asciicast.
+    JSON. This function returns a lazy iterator over the events as
+    newline-delimited JSON as well as the animator. Once the iterator has been
+    exhausted, the animator's `width` and `height` are the maximum number of
+    columns and the number of lines taken up by the asciicast.
     """
     # Play back script in interpreter REPL.
     repl = ReplClass()
@@ -33,9 +34,12 @@ def perform(
     # Convert to events with timing information.
     controller = ControllerClass()
     animator = AnimatorClass(controller, speed=speed, keypress_speed=keypress_speed)
-    relative_events = animator.render_all(interactions)
+    relative_events: Iterable[Event] = animator.render_all(interactions)
 
-    # Fix width and height if necessary
+    # Fix width and height if necessary. Since the animator tracks the size of
+    # the asciicast while rendering, doing so requires materializing all events.
+    if width <= 0 or height <= 0:
+        relative_events = [*relative_events]
     if width <= 0:
         width = animator.width + 1
     if height <= 0:
@@ -43,7 +47,4 @@ def perform(
 
     # Convert to newline-separated JSON.
     header = Header(width, height, title)
-    absolute_events = with_absolute_time(relative_events)
-    events = [*to_json_lines(header, absolute_events)]
-
-    return events, animator.width, animator.height
+    return to_absolute_json_lines(header, relative_events), animator
@@ -4,7 +4,7 @@ from collections.abc import Iterable, Iterator
 from contextlib import redirect_stderr, redirect_stdout
 import io
 import re
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 
 class Interaction(NamedTuple):
@@ -31,10 +31,19 @@ class Repl(ABC):
         """
         prompt = self.prompt()
 
-        buffer = io.StringIO()
-        with redirect_stderr(buffer):
-            with redirect_stdout(buffer):
-                self.eval(line)
+        # The buffer capturing output is created lazily, so that subclasses
+        # need not invoke this class's constructor, and is reused across lines.
+        buffer: Optional[io.StringIO] = getattr(self, "_buffer", None)
+        if buffer is None:
+            buffer = self._buffer = io.StringIO()
+        else:
+            buffer.seek(0)
+            buffer.truncate()
+
+        # Output is redirected per line only, since simulate_all() yields to
+        # code that should write to the actual stdout and stderr.
+        with redirect_stderr(buffer), redirect_stdout(buffer):
+            self.eval(line)
 
         return Interaction(f"{prompt} ", line, buffer.getvalue())
 
@@ -64,7 +73,8 @@ class PyRepl(Repl):
         return "..." if self._more else ">>>"
 
     def will_terminate(self, line: str) -> bool:
-        return self.QUIT_INVOCATION.match(line) is not None
+        # Most lines do not mention quit, so avoid the regex for them.
+        return "quit" in line and self.QUIT_INVOCATION.match(line) is not None
 
     def eval(self, line: str) -> None:
         self._more = self._interpreter.push(line[:-1])
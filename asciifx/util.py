@@ -25,4 +25,12 @@ ANSI_ESCAPE = re.compile(r'\x1b(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
 
 def no_ansi_escape(text: str) -> str:
+    # Every escape sequence starts with ESC, so skip the regex without one.
+    if "\x1b" not in text:
+        return text
     return ANSI_ESCAPE.sub("", text)
+
+
+def is_blank(text: str) -> bool:
+    # Unlike text.strip() == "", this does not copy the text.
+    return not text or text.isspace()